@@ -2,29 +2,63 @@ import argparse
 import json
 from pathlib import Path
 
+from wipt.golden import build_corpus, run_corpus
+from wipt.ocr import OcrEngine
 from wipt.pdf_processor import PdfProcessor
 
 
-def _extract_command(pdf_path: Path) -> int:
+def _extract_command(pdf_path: Path, use_ocr: bool) -> int:
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
     pdf_bytes = pdf_path.read_bytes()
-    processor = PdfProcessor()
-    result = processor.extract(pdf_bytes)
-    print(json.dumps(result.rows, indent=2, sort_keys=True))
+    if use_ocr:
+        with OcrEngine() as ocr:
+            result = PdfProcessor(ocr=ocr).extract(pdf_bytes)
+    else:
+        result = PdfProcessor().extract(pdf_bytes)
+    print(json.dumps(result.rows, indent=2))
     return 0
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _golden_command(pdf_path: Path, csv_path: Path, repeat: int, include_variants: bool) -> int:
+    for path in (pdf_path, csv_path):
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+    cases = build_corpus(pdf_path, csv_path, include_variants=include_variants)
+    report = run_corpus(PdfProcessor(), cases, repeat=repeat)
+    print(json.dumps(report.as_dict(), indent=2, sort_keys=True))
+    return 1 if report.mismatches else 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="WIPT integration helper CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     extract_parser = subparsers.add_parser("extract", help="Extract fields from a PDF")
     extract_parser.add_argument("--pdf", type=Path, required=True, help="Path to the PDF file")
+    extract_parser.add_argument("--ocr", action="store_true", help="OCR pages that have no text layer")
+
+    golden_parser = subparsers.add_parser(
+        "golden",
+        help="Check extraction against expected CSV rows and measure throughput",
+    )
+    golden_parser.add_argument("--pdf", type=Path, required=True, help="Path to the PDF file")
+    golden_parser.add_argument("--csv", type=Path, required=True, help="Path to the expected rows CSV")
+    golden_parser.add_argument("--repeat", type=_positive_int, default=1, help="Extractions per document for timing")
+    golden_parser.add_argument("--no-variants", action="store_true", help="Skip generated PDF variants")
 
     args = parser.parse_args()
     if args.command == "extract":
-        return _extract_command(args.pdf)
+        return _extract_command(args.pdf, args.ocr)
+    if args.command == "golden":
+        return _golden_command(args.pdf, args.csv, args.repeat, not args.no_variants)
     return 1
 
 
@@ -1,25 +1,51 @@
 from dataclasses import dataclass
 import os
+from typing import Optional
 
 
 @dataclass(frozen=True)
 class AppConfig:
     gmail_query: str
     gmail_max_results: int
+    gmail_num_retries: int
     google_client_secrets_path: str
     google_token_path: str
     sheets_spreadsheet_id: str
     sheets_worksheet_name: str
+    http_pool_size: int
+    http_timeout_seconds: float
+    ocr_enabled: bool
+    ocr_max_workers: int
+    offline_mode: str
+    offline_archive_path: str
+    offline_latency_ms: float
+    offline_error_rate: float
+    offline_seed: Optional[int]
+    synthetic_message_count: int
+    synthetic_pdf_path: str
 
 
 def load_config() -> AppConfig:
     gmail_query = os.getenv("GMAIL_QUERY", "has:attachment filename:pdf")
     gmail_max_results = int(os.getenv("GMAIL_MAX_RESULTS", "25"))
+    offline_seed = os.getenv("OFFLINE_SEED", "")
     return AppConfig(
         gmail_query=gmail_query,
         gmail_max_results=gmail_max_results,
+        gmail_num_retries=int(os.getenv("GMAIL_NUM_RETRIES", "0")),
         google_client_secrets_path=os.getenv("GOOGLE_CLIENT_SECRETS_PATH", ""),
         google_token_path=os.getenv("GOOGLE_TOKEN_PATH", ""),
         sheets_spreadsheet_id=os.getenv("SHEETS_SPREADSHEET_ID", ""),
         sheets_worksheet_name=os.getenv("SHEETS_WORKSHEET_NAME", "Sheet1"),
+        http_pool_size=int(os.getenv("HTTP_POOL_SIZE", "10")),
+        http_timeout_seconds=float(os.getenv("HTTP_TIMEOUT_SECONDS", "60")),
+        ocr_enabled=os.getenv("OCR_ENABLED", "false").lower() in {"1", "true", "yes"},
+        ocr_max_workers=int(os.getenv("OCR_MAX_WORKERS", "2")),
+        offline_mode=os.getenv("OFFLINE_MODE", "").lower(),
+        offline_archive_path=os.getenv("OFFLINE_ARCHIVE_PATH", ""),
+        offline_latency_ms=float(os.getenv("OFFLINE_LATENCY_MS", "0")),
+        offline_error_rate=float(os.getenv("OFFLINE_ERROR_RATE", "0")),
+        offline_seed=int(offline_seed) if offline_seed else None,
+        synthetic_message_count=int(os.getenv("SYNTHETIC_MESSAGE_COUNT", "100")),
+        synthetic_pdf_path=os.getenv("SYNTHETIC_PDF_PATH", ""),
     )
@@ -2,13 +2,36 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import base64
+import logging
 import os
-from typing import Dict, Iterable, List, Optional
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
 
+import requests
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from wipt.http_transport import DEFAULT_TIMEOUT, AuthorizedHttp, get_shared_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gmail rejects larger maxResults values for messages.list.
+MAX_LIST_PAGE_SIZE = 500
+
+_PART_FIELDS = "partId,filename,mimeType,body/attachmentId,body/size"
+_PART_MASK_DEPTH = 4
+
+
+def _part_fields_mask(depth: int) -> str:
+    if depth == 0:
+        return _PART_FIELDS
+    return f"{_PART_FIELDS},parts({_part_fields_mask(depth - 1)})"
+
+
+_MESSAGE_FIELDS = f"id,payload(headers(name,value),{_part_fields_mask(_PART_MASK_DEPTH)})"
 
 
 @dataclass(frozen=True)
@@ -26,48 +49,100 @@ class GmailMessage:
 
 
 class GmailClient:
-    def __init__(self, client_secrets_path: str, token_path: str) -> None:
+    def __init__(
+        self,
+        client_secrets_path: str,
+        token_path: str,
+        session: Optional[requests.Session] = None,
+        http: Optional[object] = None,
+        http_timeout: float = DEFAULT_TIMEOUT,
+        num_retries: int = 0,
+    ) -> None:
         self.client_secrets_path = client_secrets_path
         self.token_path = token_path
         self._scopes = ["https://www.googleapis.com/auth/gmail.readonly"]
+        self._session = session
+        self.http = http
+        self.http_timeout = http_timeout
+        self.num_retries = num_retries
+        self.failed_message_ids: List[str] = []
+        self.list_error: Optional[HttpError] = None
+        self._service = None
+        self._service_lock = threading.Lock()
 
-    def fetch_messages(self, query: str, max_results: int) -> Iterable[GmailMessage]:
+    def fetch_messages(self, query: str, max_results: int) -> Iterator[GmailMessage]:
         """Fetch candidate messages from Gmail.
 
-        Returns messages containing attachment payloads based on the query.
+        Yields up to ``max_results`` messages matching the query, following
+        list pages of at most ``MAX_LIST_PAGE_SIZE``. Messages are fetched
+        with a field mask covering only the Subject header and part
+        descriptors; the full payload is requested only when a part's data
+        is not reachable through an attachment id. A message whose requests
+        still fail after ``num_retries`` is skipped and its id recorded in
+        ``failed_message_ids``. A list page that still fails ends the listing
+        early and is recorded in ``list_error``.
         """
         service = self._build_service()
-        response = (
+        remaining = max_results
+        page_token: Optional[str] = None
+        while remaining > 0:
+            try:
+                response = (
+                    service.users()
+                    .messages()
+                    .list(
+                        userId="me",
+                        q=query,
+                        maxResults=min(remaining, MAX_LIST_PAGE_SIZE),
+                        pageToken=page_token,
+                    )
+                    .execute(num_retries=self.num_retries)
+                )
+            except HttpError as exc:
+                _LOGGER.error("Stopping Gmail listing after a failed page: %s", exc)
+                self.list_error = exc
+                return
+            messages = response.get("messages", [])[:remaining]
+            remaining -= len(messages)
+            for message in messages:
+                message_id = message["id"]
+                try:
+                    yield self._fetch_message(service, message_id)
+                except HttpError as exc:
+                    _LOGGER.warning("Skipping Gmail message %s: %s", message_id, exc)
+                    self.failed_message_ids.append(message_id)
+            page_token = response.get("nextPageToken")
+            if not page_token or not messages:
+                break
+
+    def _fetch_message(self, service, message_id: str) -> GmailMessage:
+        message_metadata = (
             service.users()
             .messages()
-            .list(userId="me", q=query, maxResults=max_results)
-            .execute()
+            .get(userId="me", id=message_id, format="full", fields=_MESSAGE_FIELDS)
+            .execute(num_retries=self.num_retries)
+        )
+        payload = message_metadata.get("payload", {})
+        subject = self._extract_subject(payload.get("headers", []))
+        attachments = self._extract_attachments(service, message_id, payload)
+        return GmailMessage(
+            message_id=message_id,
+            subject=subject,
+            attachments=attachments,
         )
-        messages = response.get("messages", [])
-        results: List[GmailMessage] = []
-        for message in messages:
-            message_id = message["id"]
-            full_message = (
-                service.users()
-                .messages()
-                .get(userId="me", id=message_id, format="full")
-                .execute()
-            )
-            payload = full_message.get("payload", {})
-            subject = self._extract_subject(payload.get("headers", []))
-            attachments = self._extract_attachments(service, message_id, payload)
-            results.append(
-                GmailMessage(
-                    message_id=message_id,
-                    subject=subject,
-                    attachments=attachments,
-                )
-            )
-        return results
+
+    def authorized_http(self) -> AuthorizedHttp:
+        """Return an authorized transport over the pooled session."""
+        if self._session is None:
+            self._session = get_shared_session()
+        return AuthorizedHttp(self._load_credentials(), self._session, timeout=self.http_timeout)
 
     def _build_service(self):
-        creds = self._load_credentials()
-        return build("gmail", "v1", credentials=creds)
+        with self._service_lock:
+            if self._service is None:
+                http = self.http or self.authorized_http()
+                self._service = build("gmail", "v1", http=http, cache_discovery=False)
+            return self._service
 
     def _load_credentials(self) -> Credentials:
         creds: Optional[Credentials] = None
@@ -100,6 +175,7 @@ class GmailClient:
         payload: Dict[str, object],
     ) -> List[GmailAttachment]:
         attachments: List[GmailAttachment] = []
+        full_parts: Optional[Dict[str, Dict[str, object]]] = None
         stack = [payload]
         while stack:
             part = stack.pop()
@@ -108,7 +184,13 @@ class GmailClient:
             filename = part.get("filename")
             body = part.get("body", {})
             mime_type = part.get("mimeType", "")
+            part_id = part.get("partId", "")
             if filename:
+                if not body.get("attachmentId") and not body.get("data") and body.get("size"):
+                    # Inline data is excluded by the field mask.
+                    if full_parts is None:
+                        full_parts = self._fetch_full_parts(service, message_id)
+                    body = full_parts.get(part_id, {}).get("body", {})
                 data = self._get_attachment_data(service, message_id, body)
                 if data:
                     attachments.append(
@@ -118,10 +200,33 @@ class GmailClient:
                             data=data,
                         )
                     )
-            for subpart in part.get("parts", []) or []:
+            subparts = part.get("parts")
+            if not subparts and mime_type.startswith("multipart/"):
+                # Nested deeper than the field mask reaches.
+                if full_parts is None:
+                    full_parts = self._fetch_full_parts(service, message_id)
+                subparts = full_parts.get(part_id, {}).get("parts")
+            for subpart in subparts or []:
                 stack.append(subpart)
         return attachments
 
+    def _fetch_full_parts(self, service, message_id: str) -> Dict[str, Dict[str, object]]:
+        full_message = (
+            service.users()
+            .messages()
+            .get(userId="me", id=message_id, format="full", fields="payload")
+            .execute(num_retries=self.num_retries)
+        )
+        parts_by_id: Dict[str, Dict[str, object]] = {}
+        stack = [full_message.get("payload", {})]
+        while stack:
+            part = stack.pop()
+            if not part:
+                continue
+            parts_by_id[part.get("partId", "")] = part
+            stack.extend(part.get("parts", []) or [])
+        return parts_by_id
+
     def _get_attachment_data(
         self,
         service,
@@ -139,7 +244,7 @@ class GmailClient:
             .messages()
             .attachments()
             .get(userId="me", messageId=message_id, id=attachment_id)
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         attachment_data = attachment.get("data")
         if not attachment_data:
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import csv
+from dataclasses import asdict, dataclass
+from decimal import Decimal, InvalidOperation
+import io
+from pathlib import Path
+import time
+
+from wipt.pdf_processor import PdfProcessor
+from wipt.rows import COLUMNS, PurchaseOrderRow
+
+NUMERIC_KEYS = frozenset({"quantity", "price", "total"})
+
+
+@dataclass(frozen=True)
+class CorpusCase:
+    name: str
+    pdf_bytes: bytes
+    expected_rows: list[dict[str, str]]
+
+
+@dataclass(frozen=True)
+class FieldMismatch:
+    case: str
+    row_index: int
+    column: str
+    expected: str
+    actual: str
+
+
+@dataclass(frozen=True)
+class CorpusReport:
+    documents: int
+    fields_checked: int
+    mismatches: list[FieldMismatch]
+    elapsed_seconds: float
+
+    @property
+    def accuracy(self) -> float:
+        if not self.fields_checked:
+            return 1.0
+        return 1 - len(self.mismatches) / self.fields_checked
+
+    @property
+    def docs_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.documents / self.elapsed_seconds
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "documents": self.documents,
+            "fields_checked": self.fields_checked,
+            "accuracy": self.accuracy,
+            "docs_per_second": self.docs_per_second,
+            "elapsed_seconds": self.elapsed_seconds,
+            "mismatches": [asdict(mismatch) for mismatch in self.mismatches],
+        }
+
+
+def load_expected_rows(csv_path: Path) -> list[dict[str, str]]:
+    """Read sheet rows from a CSV export, keyed by ``COLUMNS`` key.
+
+    Raises ``ValueError`` if the CSV header does not match ``COLUMNS``.
+    """
+    expected_headers = [column.header for column in COLUMNS]
+    with csv_path.open(newline="") as file:
+        reader = csv.DictReader(file)
+        if reader.fieldnames != expected_headers:
+            raise ValueError(f"{csv_path} columns {reader.fieldnames} do not match {expected_headers}")
+        return [{column.key: row.get(column.header, "") for column in COLUMNS} for row in reader]
+
+
+def generate_variants(pdf_bytes: bytes) -> dict[str, bytes]:
+    """Return byte-level variants of a PDF that must extract to the same rows."""
+    import pypdfium2
+
+    variants = {"original": pdf_bytes, "trailing-bytes": pdf_bytes + b"\n% padding\n" * 16}
+    document = pypdfium2.PdfDocument(pdf_bytes)
+    try:
+        for name, version in (("rewritten", None), ("rewritten-pdf17", 17)):
+            buffer = io.BytesIO()
+            document.save(buffer, version=version)
+            variants[name] = buffer.getvalue()
+    finally:
+        document.close()
+    return variants
+
+
+def build_corpus(pdf_path: Path, csv_path: Path, include_variants: bool = True) -> list[CorpusCase]:
+    pdf_bytes = pdf_path.read_bytes()
+    expected_rows = load_expected_rows(csv_path)
+    variants = generate_variants(pdf_bytes) if include_variants else {"original": pdf_bytes}
+    return [
+        CorpusCase(name=f"{pdf_path.name}:{name}", pdf_bytes=data, expected_rows=expected_rows)
+        for name, data in variants.items()
+    ]
+
+
+def run_corpus(processor: PdfProcessor, cases: list[CorpusCase], repeat: int = 1) -> CorpusReport:
+    """Extract every case ``repeat`` times and diff the first run against expectations."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    mismatches: list[FieldMismatch] = []
+    fields_checked = 0
+    elapsed = 0.0
+    for case in cases:
+        records: list[PurchaseOrderRow] = []
+        for attempt in range(repeat):
+            started = time.perf_counter()
+            result = processor.extract(case.pdf_bytes)
+            elapsed += time.perf_counter() - started
+            if attempt == 0:
+                records = result.records
+        case_mismatches, case_fields = diff_rows(case.name, records, case.expected_rows)
+        mismatches.extend(case_mismatches)
+        fields_checked += case_fields
+    return CorpusReport(
+        documents=len(cases) * repeat,
+        fields_checked=fields_checked,
+        mismatches=mismatches,
+        elapsed_seconds=elapsed,
+    )
+
+
+def diff_rows(
+    case: str,
+    records: list[PurchaseOrderRow],
+    expected_rows: list[dict[str, str]],
+) -> tuple[list[FieldMismatch], int]:
+    """Compare extracted records with expected rows field by field.
+
+    Missing or extra rows count as mismatches on every column. Returns the
+    mismatches and the number of fields compared.
+    """
+    mismatches: list[FieldMismatch] = []
+    row_count = max(len(records), len(expected_rows))
+    for index in range(row_count):
+        record = records[index] if index < len(records) else None
+        expected = expected_rows[index] if index < len(expected_rows) else {}
+        for column in COLUMNS:
+            actual_value = record.value(column.key) if record is not None else ""
+            expected_value = expected.get(column.key, "")
+            if record is None or not expected or not _values_match(column.key, actual_value, expected_value):
+                mismatches.append(
+                    FieldMismatch(
+                        case=case,
+                        row_index=index,
+                        column=column.key,
+                        expected=expected_value,
+                        actual=actual_value,
+                    )
+                )
+    return mismatches, row_count * len(COLUMNS)
+
+
+def _values_match(key: str, actual: str, expected: str) -> bool:
+    if key in NUMERIC_KEYS:
+        actual_number = _normalize_number(actual)
+        expected_number = _normalize_number(expected)
+        if actual_number is not None or expected_number is not None:
+            return actual_number == expected_number
+    return _normalize_text(actual) == _normalize_text(expected)
+
+
+def _normalize_text(value: str) -> str:
+    cleaned = value.replace("\r", " ").replace("\n", " ").replace(",", " ")
+    return " ".join(cleaned.split())
+
+
+def _normalize_number(value: str) -> Decimal | None:
+    if not value.strip():
+        return None
+    try:
+        return Decimal(value.replace(",", ""))
+    except InvalidOperation:
+        return None
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, Mapping, Optional, Tuple
+
+import requests
+from google.auth.credentials import Credentials
+from google.auth.transport import DEFAULT_MAX_REFRESH_ATTEMPTS, DEFAULT_REFRESH_STATUS_CODES
+from google.auth.transport.requests import Request
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 60.0
+
+_LOGGER = logging.getLogger(__name__)
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_pool_size: Optional[int] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session(pool_size: Optional[int] = None) -> requests.Session:
+    """Return the process-wide pooled session used by the Google API clients.
+
+    The session is created on first use with ``pool_size`` (default
+    ``DEFAULT_POOL_SIZE``). A later call asking for a different size gets
+    the existing session and logs a warning.
+    """
+    global _shared_session, _shared_session_pool_size
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session_pool_size = pool_size or DEFAULT_POOL_SIZE
+            _shared_session = _create_session(_shared_session_pool_size)
+        elif pool_size is not None and pool_size != _shared_session_pool_size:
+            _LOGGER.warning(
+                "Shared HTTP session already created with pool size %s; ignoring requested size %s",
+                _shared_session_pool_size,
+                pool_size,
+            )
+        return _shared_session
+
+
+def _create_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+class HttpResponse(dict):
+    """httplib2-style response headers and status, as googleapiclient expects."""
+
+    def __init__(self, status: int, reason: str = "", headers: Optional[Mapping[str, str]] = None) -> None:
+        super().__init__((key.lower(), value) for key, value in (headers or {}).items())
+        self.status = status
+        self.reason = reason
+        self["status"] = str(status)
+
+    @classmethod
+    def from_requests(cls, response: requests.Response) -> "HttpResponse":
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+        if response_headers.pop("content-encoding", None) is not None:
+            # requests has already decoded the body; like httplib2, report the
+            # decoded length instead of the compressed one.
+            response_headers["content-length"] = str(len(response.content))
+        return cls(response.status_code, response.reason, response_headers)
+
+
+class AuthorizedHttp:
+    """Thread-safe stand-in for ``httplib2.Http`` backed by a pooled session.
+
+    Passed to ``googleapiclient.discovery.build(http=...)``; each request is
+    authorized with ``credentials`` and sent over the shared connection pool.
+    """
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        session: requests.Session,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.credentials = credentials
+        self._session = session
+        self.timeout = timeout
+        # Token refreshes get their own session: ``Request`` closes the session
+        # it wraps when garbage-collected, which would drain the shared pool.
+        self._auth_request = Request()
+        self._refresh_lock = threading.Lock()
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **_kwargs: object,
+    ) -> Tuple[HttpResponse, bytes]:
+        response = self._send(uri, method, body, headers)
+        attempts = 0
+        while response.status_code in DEFAULT_REFRESH_STATUS_CODES and attempts < DEFAULT_MAX_REFRESH_ATTEMPTS:
+            attempts += 1
+            with self._refresh_lock:
+                self.credentials.refresh(self._auth_request)
+            response = self._send(uri, method, body, headers)
+        return HttpResponse.from_requests(response), response.content
+
+    def _send(
+        self,
+        uri: str,
+        method: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        request_headers = dict(headers or {})
+        with self._refresh_lock:
+            self.credentials.before_request(self._auth_request, method, uri, request_headers)
+        return self._session.request(method, uri, data=body, headers=request_headers, timeout=self.timeout)
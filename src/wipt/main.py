@@ -1,27 +1,69 @@
+import logging
+from pathlib import Path
+
 from dotenv import load_dotenv
 
-from wipt.config import load_config
+from wipt.config import AppConfig, load_config
 from wipt.gmail_client import GmailClient
+from wipt.http_transport import get_shared_session
+from wipt.ocr import OcrEngine
+from wipt.offline import ArchiveSheetsClient, build_offline_http, load_offline_archive
 from wipt.pdf_processor import PdfProcessor
 from wipt.pdf_selector import PdfSelector
 from wipt.sheets_client import SheetsClient
 
+_LOGGER = logging.getLogger(__name__)
+
 
-def main() -> None:
+def main() -> int:
     load_dotenv()
     config = load_config()
+    session = get_shared_session(pool_size=config.http_pool_size)
 
     gmail_client = GmailClient(
         client_secrets_path=config.google_client_secrets_path,
         token_path=config.google_token_path,
+        session=session,
+        http_timeout=config.http_timeout_seconds,
+        num_retries=config.gmail_num_retries,
     )
     pdf_selector = PdfSelector()
-    pdf_processor = PdfProcessor()
+    ocr = OcrEngine(max_workers=config.ocr_max_workers) if config.ocr_enabled else None
+    pdf_processor = PdfProcessor(ocr=ocr)
     sheets_client = SheetsClient(
         spreadsheet_id=config.sheets_spreadsheet_id,
         worksheet_name=config.sheets_worksheet_name,
+        session=session,
     )
 
+    archive = None
+    if config.offline_mode:
+        archive = load_offline_archive(config)
+        gmail_client.http = build_offline_http(config, archive, gmail_client)
+        sheets_client = ArchiveSheetsClient(
+            spreadsheet_id=config.sheets_spreadsheet_id,
+            worksheet_name=config.sheets_worksheet_name,
+            archive=archive,
+            latency_seconds=config.offline_latency_ms / 1000,
+        )
+
+    try:
+        _process_messages(config, gmail_client, pdf_selector, pdf_processor, sheets_client)
+    finally:
+        if ocr is not None:
+            ocr.close()
+        if config.offline_mode == "record":
+            archive.save(Path(config.offline_archive_path))
+    return _report_gmail_failures(gmail_client)
+
+
+def _process_messages(
+    config: AppConfig,
+    gmail_client: GmailClient,
+    pdf_selector: PdfSelector,
+    pdf_processor: PdfProcessor,
+    sheets_client: SheetsClient,
+) -> None:
     messages = gmail_client.fetch_messages(
         query=config.gmail_query,
         max_results=config.gmail_max_results,
@@ -31,26 +73,19 @@ def main() -> None:
         selected_pdfs = pdf_selector.select(message.attachments)
         for pdf in selected_pdfs:
             extraction = pdf_processor.extract(pdf.data)
-            for row in extraction.rows:
-                row_values = [
-                    row.get("process_time", ""),
-                    row.get("client_info", ""),
-                    row.get("ship_to_address", ""),
-                    row.get("purchase_order_id", ""),
-                    row.get("purchase_order_date", ""),
-                    row.get("sales_person", ""),
-                    row.get("due_date", ""),
-                    row.get("item", ""),
-                    row.get("description", ""),
-                    row.get("quantity", ""),
-                    row.get("price", ""),
-                    row.get("total", ""),
-                    row.get("status", ""),
-                    row.get("invoice_created", ""),
-                    row.get("po_created", ""),
-                ]
-                sheets_client.append_row(row_values)
+            for record in extraction.records:
+                sheets_client.append_row(record.values())
+
+
+def _report_gmail_failures(gmail_client: GmailClient) -> int:
+    """Log messages the run could not fetch; return the process exit status."""
+    failed = gmail_client.failed_message_ids
+    if failed:
+        _LOGGER.error("Skipped %d Gmail message(s): %s", len(failed), ", ".join(failed))
+    if gmail_client.list_error is not None:
+        _LOGGER.error("Gmail listing ended early; later messages were not processed")
+    return 1 if failed or gmail_client.list_error is not None else 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
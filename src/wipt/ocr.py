@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_OCR_WORKERS = 2
+DEFAULT_OCR_RESOLUTION = 300
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def run_tesseract(pdf_bytes: bytes, page_number: int, resolution: int) -> str:
+    """Rasterize one page of ``pdf_bytes`` and OCR it with a local Tesseract install."""
+    import pypdfium2
+    import pytesseract
+
+    document = pypdfium2.PdfDocument(pdf_bytes)
+    try:
+        image = document[page_number].render(scale=resolution / 72).to_pil()
+    finally:
+        document.close()
+    return pytesseract.image_to_string(image)
+
+
+def check_tesseract() -> None:
+    """Fail fast when pytesseract or the tesseract binary is unavailable."""
+    try:
+        import pytesseract
+
+        pytesseract.get_tesseract_version()
+    except Exception as exc:
+        raise RuntimeError("OCR requires the pytesseract package and a tesseract binary on PATH") from exc
+
+
+def _page_content_key(page: object) -> str:
+    """Return a SHA-256 over a pdfplumber page's content streams and XObjects.
+
+    Scanned pages share a near-identical content stream that only paints an
+    image, so the page's top-level XObject data is hashed as well.
+    """
+    from pdfminer.pdftypes import resolve1
+
+    page_obj = page.page_obj
+    digest = hashlib.sha256()
+    for stream in page_obj.contents:
+        digest.update(resolve1(stream).get_data())
+    resources = resolve1(page_obj.resources) or {}
+    xobjects = resolve1(resources.get("XObject")) or {}
+    for name in sorted(xobjects):
+        digest.update(name.encode("utf-8"))
+        digest.update(resolve1(xobjects[name]).get_data())
+    return digest.hexdigest()
+
+
+class OcrEngine:
+    """OCR fallback for pages without a text layer.
+
+    Text-less pages are rasterized and recognised in a separate, bounded
+    process pool so OCR cannot starve text-layer extraction. Results are
+    cached by a hash of the page's PDF content, taken before any rendering.
+    A page whose OCR fails is logged and left empty. When using the default
+    Tesseract backend, a missing install raises at construction time.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_OCR_WORKERS,
+        resolution: int = DEFAULT_OCR_RESOLUTION,
+        ocr_function: Callable[[bytes, int, int], str] = run_tesseract,
+    ) -> None:
+        if ocr_function is run_tesseract:
+            check_tesseract()
+        self.max_workers = max_workers
+        self.resolution = resolution
+        self._ocr_function = ocr_function
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def fill_missing_text(self, pdf_bytes: bytes, pages: List[object], pages_text: List[str]) -> List[str]:
+        """Return ``pages_text`` with OCR output for pages of ``pdf_bytes`` that had no text."""
+        pending: Dict[int, Tuple[str, Future]] = {}
+        filled = list(pages_text)
+        for index, (page, text) in enumerate(zip(pages, pages_text)):
+            if text.strip():
+                continue
+            key = f"{self.resolution}:{_page_content_key(page)}"
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                filled[index] = cached
+                continue
+            future = self._get_executor().submit(self._ocr_function, pdf_bytes, index, self.resolution)
+            pending[index] = (key, future)
+        for index, (key, future) in pending.items():
+            try:
+                text = future.result() or ""
+            except Exception:
+                _LOGGER.exception("OCR failed for page %d; leaving its text empty", index + 1)
+                continue
+            with self._lock:
+                self._cache[key] = text
+            filled[index] = text
+        return filled
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "OcrEngine":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
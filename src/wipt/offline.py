@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import base64
+import json
+from pathlib import Path
+import random
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from wipt.config import AppConfig
+from wipt.gmail_client import MAX_LIST_PAGE_SIZE, GmailClient
+from wipt.http_transport import HttpResponse
+from wipt.sheets_client import SheetsClient
+
+OFFLINE_MODES = ("record", "replay", "synthetic")
+
+_MESSAGES_PATH = re.compile(
+    r"/gmail/v1/users/me/messages(?:/(?P<id>[^/]+)(?:/attachments/(?P<attachment_id>[^/]+))?)?$"
+)
+
+
+class OfflineArchive:
+    """Recorded Gmail responses and Sheets rows, persisted as one JSON file.
+
+    Responses are keyed by HTTP method and full request URI. Request headers
+    are not stored, so the archive never contains credentials.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, Dict[str, object]]] = None,
+        sheet_rows: Optional[List[List[str]]] = None,
+    ) -> None:
+        self.responses = responses or {}
+        self.sheet_rows = sheet_rows or []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> "OfflineArchive":
+        with path.open(encoding="utf-8") as archive_file:
+            data = json.load(archive_file)
+        return cls(responses=data.get("responses", {}), sheet_rows=data.get("sheet_rows", []))
+
+    def save(self, path: Path) -> None:
+        with self._lock:
+            data = {"responses": self.responses, "sheet_rows": self.sheet_rows}
+        with path.open("w", encoding="utf-8") as archive_file:
+            json.dump(data, archive_file, indent=2, sort_keys=True)
+
+    def record_response(self, method: str, uri: str, response: HttpResponse, content: bytes) -> None:
+        entry = {
+            "status": response.status,
+            "reason": response.reason,
+            "content_type": response.get("content-type", ""),
+            "content": content.decode("utf-8"),
+        }
+        with self._lock:
+            self.responses[_request_key(method, uri)] = entry
+
+    def lookup_response(self, method: str, uri: str) -> Optional[Tuple[HttpResponse, bytes]]:
+        with self._lock:
+            entry = self.responses.get(_request_key(method, uri))
+        if entry is None:
+            return None
+        response = HttpResponse(entry["status"], entry["reason"], {"content-type": entry["content_type"]})
+        return response, entry["content"].encode("utf-8")
+
+    def append_sheet_row(self, row_values: Iterable[str]) -> None:
+        with self._lock:
+            self.sheet_rows.append(list(row_values))
+
+
+def _request_key(method: str, uri: str) -> str:
+    return f"{method.upper()} {uri}"
+
+
+def _json_response(status: int, reason: str, payload: Dict[str, object]) -> Tuple[HttpResponse, bytes]:
+    response = HttpResponse(status, reason, {"content-type": "application/json; charset=UTF-8"})
+    return response, json.dumps(payload).encode("utf-8")
+
+
+def _error_response(status: int, reason: str, message: str) -> Tuple[HttpResponse, bytes]:
+    return _json_response(status, reason, {"error": {"code": status, "message": message}})
+
+
+class RecordingHttp:
+    """Pass requests through to ``inner`` and store every response in ``archive``."""
+
+    def __init__(self, inner: object, archive: OfflineArchive) -> None:
+        self.inner = inner
+        self.archive = archive
+        self.credentials = getattr(inner, "credentials", None)
+
+    def request(self, uri: str, method: str = "GET", body=None, headers=None, **kwargs: object):
+        response, content = self.inner.request(uri, method=method, body=body, headers=headers, **kwargs)
+        self.archive.record_response(method, uri, response, content)
+        return response, content
+
+
+class _SimulatedHttp(ABC):
+    """Shared latency and error injection for the offline transports."""
+
+    credentials = None
+
+    def __init__(self, latency_seconds: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None) -> None:
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def request(self, uri: str, method: str = "GET", body=None, headers=None, **_kwargs: object):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.error_rate:
+            with self._random_lock:
+                failed = self._random.random() < self.error_rate
+                if failed:
+                    self.injected_errors += 1
+            if failed:
+                return _error_response(503, "Service Unavailable", "Injected offline error")
+        return self._respond(method, uri)
+
+    @abstractmethod
+    def _respond(self, method: str, uri: str) -> Tuple[HttpResponse, bytes]:
+        """Return the simulated response for a request that was not failed."""
+
+
+class ReplayHttp(_SimulatedHttp):
+    """Serve responses from an ``OfflineArchive``; unknown requests get a 404."""
+
+    def __init__(
+        self,
+        archive: OfflineArchive,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(latency_seconds, error_rate, seed)
+        self.archive = archive
+
+    def _respond(self, method: str, uri: str) -> Tuple[HttpResponse, bytes]:
+        recorded = self.archive.lookup_response(method, uri)
+        if recorded is None:
+            return _error_response(404, "Not Found", f"No recorded response for {method} {uri}")
+        return recorded
+
+
+class SyntheticMailboxHttp(_SimulatedHttp):
+    """Generate a Gmail mailbox of ``message_count`` messages on the fly.
+
+    Every message carries the same PDF attachment, so the fake itself holds
+    no per-message state. List pages are capped at ``MAX_LIST_PAGE_SIZE``
+    like Gmail's.
+    """
+
+    def __init__(
+        self,
+        message_count: int,
+        pdf_bytes: bytes,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(latency_seconds, error_rate, seed)
+        self.message_count = message_count
+        self._pdf_size = len(pdf_bytes)
+        self._pdf_data = base64.urlsafe_b64encode(pdf_bytes).decode("utf-8")
+
+    def _respond(self, method: str, uri: str) -> Tuple[HttpResponse, bytes]:
+        parts = urlsplit(uri)
+        match = _MESSAGES_PATH.search(parts.path)
+        if method.upper() != "GET" or not match:
+            return _error_response(404, "Not Found", f"Unsupported synthetic request {method} {uri}")
+        message_id = match.group("id")
+        if message_id is None:
+            return self._list_messages(parse_qs(parts.query))
+        index = self._message_index(message_id)
+        if index is None:
+            return _error_response(404, "Not Found", f"Unknown message {message_id}")
+        if match.group("attachment_id") is not None:
+            return _json_response(200, "OK", {"size": self._pdf_size, "data": self._pdf_data})
+        return _json_response(200, "OK", self._message(message_id, index))
+
+    def _list_messages(self, query: Dict[str, List[str]]) -> Tuple[HttpResponse, bytes]:
+        max_results = min(int(query.get("maxResults", ["100"])[0]), MAX_LIST_PAGE_SIZE)
+        start = int(query.get("pageToken", ["0"])[0])
+        end = min(start + max_results, self.message_count)
+        payload: Dict[str, object] = {
+            "messages": [
+                {"id": self._message_id(index), "threadId": self._message_id(index)} for index in range(start, end)
+            ],
+            "resultSizeEstimate": self.message_count,
+        }
+        if end < self.message_count:
+            payload["nextPageToken"] = str(end)
+        return _json_response(200, "OK", payload)
+
+    def _message(self, message_id: str, index: int) -> Dict[str, object]:
+        return {
+            "id": message_id,
+            "payload": {
+                "partId": "",
+                "mimeType": "multipart/mixed",
+                "headers": [{"name": "Subject", "value": f"Synthetic purchase order {index}"}],
+                "parts": [
+                    {"partId": "0", "mimeType": "text/html", "filename": "", "body": {"size": 0}},
+                    {
+                        "partId": "1",
+                        "mimeType": "application/pdf",
+                        "filename": f"PO_synthetic_{index:05d}.pdf",
+                        "body": {"attachmentId": f"attachment-{index}", "size": self._pdf_size},
+                    },
+                ],
+            },
+        }
+
+    @staticmethod
+    def _message_id(index: int) -> str:
+        return f"synthetic-{index:05d}"
+
+    def _message_index(self, message_id: str) -> Optional[int]:
+        prefix, _, number = message_id.partition("-")
+        if prefix != "synthetic" or not number.isdigit():
+            return None
+        index = int(number)
+        return index if index < self.message_count else None
+
+
+class ArchiveSheetsClient(SheetsClient):
+    """Sheets writer that captures appended rows in an ``OfflineArchive``."""
+
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        archive: OfflineArchive,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(spreadsheet_id, worksheet_name)
+        self.archive = archive
+        self.latency_seconds = latency_seconds
+
+    def append_row(self, row_values: Iterable[str]) -> None:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        self.archive.append_sheet_row(row_values)
+
+
+def load_offline_archive(config: AppConfig) -> OfflineArchive:
+    """Return the archive for ``config.offline_mode``; only replay reads from disk."""
+    if config.offline_mode in ("record", "replay") and not config.offline_archive_path:
+        raise ValueError(f"OFFLINE_ARCHIVE_PATH is required when OFFLINE_MODE={config.offline_mode}")
+    if config.offline_mode == "replay":
+        return OfflineArchive.load(Path(config.offline_archive_path))
+    return OfflineArchive()
+
+
+def build_offline_http(config: AppConfig, archive: OfflineArchive, gmail_client: GmailClient) -> object:
+    """Return the Gmail transport for ``config.offline_mode``."""
+    latency_seconds = config.offline_latency_ms / 1000
+    if config.offline_mode == "record":
+        return RecordingHttp(gmail_client.authorized_http(), archive)
+    if config.offline_mode == "replay":
+        return ReplayHttp(archive, latency_seconds, config.offline_error_rate, config.offline_seed)
+    if config.offline_mode == "synthetic":
+        if not config.synthetic_pdf_path:
+            raise ValueError("SYNTHETIC_PDF_PATH is required when OFFLINE_MODE=synthetic")
+        pdf_bytes = Path(config.synthetic_pdf_path).read_bytes()
+        return SyntheticMailboxHttp(
+            config.synthetic_message_count,
+            pdf_bytes,
+            latency_seconds,
+            config.offline_error_rate,
+            config.offline_seed,
+        )
+    raise ValueError(f"Unknown OFFLINE_MODE {config.offline_mode!r}; expected one of {OFFLINE_MODES}")
@@ -1,15 +1,26 @@
 from dataclasses import dataclass
+from functools import cached_property
 import io
 import re
 
+from wipt.ocr import OcrEngine
+from wipt.rows import EMPTY_LINE_ITEM, LineItem, PurchaseOrderHeader, PurchaseOrderRow
 
 
 @dataclass(frozen=True)
 class PdfExtractionResult:
-    rows: list[dict[str, str]]
+    records: list[PurchaseOrderRow]
+
+    @cached_property
+    def rows(self) -> list[dict[str, str]]:
+        """Plain dict rows for callers of the old API, built on first access."""
+        return [record.as_dict() for record in self.records]
 
 
 class PdfProcessor:
+    def __init__(self, ocr: OcrEngine | None = None) -> None:
+        self.ocr = ocr
+
     def extract(self, pdf_bytes: bytes) -> PdfExtractionResult:
         """Extract structured fields from a PDF.
 
@@ -20,42 +31,22 @@ class PdfProcessor:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             pages = list(pdf.pages)
             pages_text = [page.extract_text() or "" for page in pages]
+            if self.ocr is not None:
+                pages_text = self.ocr.fill_missing_text(pdf_bytes, pages, pages_text)
         full_text = "\n".join(pages_text)
-        base_fields = _extract_base_fields_from_pages(pages, full_text)
-        return _build_result_rows(full_text, base_fields)
+        header = _extract_base_fields_from_pages(pages, full_text)
+        return _build_result_rows(full_text, header)
 
     def extract_rows_from_text(self, text: str) -> PdfExtractionResult:
-        base_fields = _extract_base_fields_from_text(text)
-        return _build_result_rows(text, base_fields)
-
-
-def _build_result_rows(text: str, base_fields: dict[str, str]) -> PdfExtractionResult:
-    line_items = _extract_line_items(text)
-    rows: list[dict[str, str]] = []
-    if not line_items:
-        rows.append(
-            {
-                **base_fields,
-                "item": "",
-                "description": "",
-                "quantity": "",
-                "price": "",
-                "total": "",
-            }
-        )
-    else:
-        for line_item in line_items:
-            rows.append(
-                {
-                    **base_fields,
-                    "item": line_item.item,
-                    "description": line_item.description,
-                    "quantity": line_item.quantity,
-                    "price": line_item.price,
-                    "total": line_item.total,
-                }
-            )
-    return PdfExtractionResult(rows=rows)
+        header = _extract_base_fields_from_text(text)
+        return _build_result_rows(text, header)
+
+
+def _build_result_rows(text: str, header: PurchaseOrderHeader) -> PdfExtractionResult:
+    line_items = _extract_line_items(text) or [EMPTY_LINE_ITEM]
+    return PdfExtractionResult(
+        records=[PurchaseOrderRow(header=header, line_item=line_item) for line_item in line_items]
+    )
 
 
 def _extract_first_match(text: str, pattern: str) -> str:
@@ -65,32 +56,29 @@ def _extract_first_match(text: str, pattern: str) -> str:
     return match.group(1).strip()
 
 
-def _extract_base_fields_from_text(text: str) -> dict[str, str]:
+def _extract_base_fields_from_text(text: str) -> PurchaseOrderHeader:
     purchase_order_date = _extract_first_match(text, r"\bDate\s+(\d{1,2}/\d{1,2}/\d{4})")
-    return {
-        "process_time": purchase_order_date,
-        "client_info": ", ".join(_extract_header_block(text, "Purchase Order")),
-        "ship_to_address": ", ".join(_extract_block(text, "Ship To", ("Salesperson", "Terms", "Due Date", "Item"))),
-        "purchase_order_id": _extract_first_match(text, r"\bP\.O\.\s*No\.\s*([A-Za-z0-9-]+)"),
-        "purchase_order_date": purchase_order_date,
-        "sales_person": _extract_first_match(text, r"\bSalesperson\s+([A-Za-z .'-]+)"),
-        "due_date": _extract_first_match(text, r"\bDue Date\s+(\d{1,2}/\d{1,2}/\d{4})"),
-        "status": "NEW",
-        "invoice_created": "No",
-        "po_created": "No",
-    }
-
-
-def _extract_base_fields_from_pages(pages: list[object], text: str) -> dict[str, str]:
+    return PurchaseOrderHeader(
+        process_time=purchase_order_date,
+        client_info=", ".join(_extract_header_block(text, "Purchase Order")),
+        ship_to_address=", ".join(_extract_block(text, "Ship To", ("Salesperson", "Terms", "Due Date", "Item"))),
+        purchase_order_id=_extract_first_match(text, r"\bP\.O\.\s*No\.\s*([A-Za-z0-9-]+)"),
+        purchase_order_date=purchase_order_date,
+        sales_person=_extract_first_match(text, r"\bSalesperson\s+([A-Za-z .'-]+)"),
+        due_date=_extract_first_match(text, r"\bDue Date\s+(\d{1,2}/\d{1,2}/\d{4})"),
+    )
+
+
+def _extract_base_fields_from_pages(pages: list[object], text: str) -> PurchaseOrderHeader:
     for page in pages:
         try:
             columns = _extract_column_lines(page)
         except Exception:
             columns = []
         if columns:
-            base_fields = _extract_base_fields_from_columns(columns)
-            if base_fields["purchase_order_id"] or base_fields["purchase_order_date"]:
-                return base_fields
+            header = _extract_base_fields_from_columns(columns)
+            if header.purchase_order_id or header.purchase_order_date:
+                return header
     return _extract_base_fields_from_text(text)
 
 
@@ -121,7 +109,7 @@ def _extract_column_lines(page: object) -> list[tuple[str, str]]:
     return columns
 
 
-def _extract_base_fields_from_columns(columns: list[tuple[str, str]]) -> dict[str, str]:
+def _extract_base_fields_from_columns(columns: list[tuple[str, str]]) -> PurchaseOrderHeader:
     vendor_index = None
     for index, (left, right) in enumerate(columns):
         if "Vendor" in left and "Ship" in right:
@@ -170,18 +158,15 @@ def _extract_base_fields_from_columns(columns: list[tuple[str, str]]) -> dict[st
                 sales_person = value_line.replace(due_date, "").strip()
             break
 
-    return {
-        "process_time": purchase_order_date,
-        "client_info": ", ".join(client_info_lines),
-        "ship_to_address": ", ".join(ship_to_lines),
-        "purchase_order_id": purchase_order_id,
-        "purchase_order_date": purchase_order_date,
-        "sales_person": sales_person,
-        "due_date": due_date,
-        "status": "NEW",
-        "invoice_created": "No",
-        "po_created": "No",
-    }
+    return PurchaseOrderHeader(
+        process_time=purchase_order_date,
+        client_info=", ".join(client_info_lines),
+        ship_to_address=", ".join(ship_to_lines),
+        purchase_order_id=purchase_order_id,
+        purchase_order_date=purchase_order_date,
+        sales_person=sales_person,
+        due_date=due_date,
+    )
 
 def _extract_block(text: str, header: str, stop_headers: tuple[str, ...]) -> list[str]:
     lines = [line.strip() for line in text.splitlines()]
@@ -214,15 +199,6 @@ def _extract_header_block(text: str, stop_header: str) -> list[str]:
     return header_lines
 
 
-@dataclass(frozen=True)
-class LineItem:
-    item: str
-    description: str
-    quantity: str
-    price: str
-    total: str
-
-
 def _extract_line_items(text: str) -> list[LineItem]:
     lines = [line.strip() for line in text.splitlines()]
     item_code_pattern = re.compile(r"^(?=.*\d)(?=.*-)[A-Za-z0-9-]+$")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    key: str
+    header: str
+
+
+COLUMNS: tuple[Column, ...] = (
+    Column("process_time", "Process Time"),
+    Column("client_info", "Client Info"),
+    Column("ship_to_address", "ShipTo Address"),
+    Column("purchase_order_id", "Purchase Order Id"),
+    Column("purchase_order_date", "Purchase Order Date"),
+    Column("sales_person", "Sales Person"),
+    Column("due_date", "Due Date"),
+    Column("item", "Item"),
+    Column("description", "Description"),
+    Column("quantity", "Quantity"),
+    Column("price", "Price"),
+    Column("total", "Total"),
+    Column("status", "Status"),
+    Column("invoice_created", "Invoice Created?"),
+    Column("po_created", "PO Created?"),
+)
+COLUMN_KEYS: tuple[str, ...] = tuple(column.key for column in COLUMNS)
+LINE_ITEM_KEYS = frozenset({"item", "description", "quantity", "price", "total"})
+
+
+@dataclass(frozen=True, slots=True)
+class PurchaseOrderHeader:
+    """Fields shared by every line item of one purchase order."""
+
+    process_time: str = ""
+    client_info: str = ""
+    ship_to_address: str = ""
+    purchase_order_id: str = ""
+    purchase_order_date: str = ""
+    sales_person: str = ""
+    due_date: str = ""
+    status: str = "NEW"
+    invoice_created: str = "No"
+    po_created: str = "No"
+
+
+@dataclass(frozen=True, slots=True)
+class LineItem:
+    item: str
+    description: str
+    quantity: str
+    price: str
+    total: str
+
+
+EMPTY_LINE_ITEM = LineItem(item="", description="", quantity="", price="", total="")
+
+
+@dataclass(frozen=True, slots=True)
+class PurchaseOrderRow:
+    """One sheet row: a shared header plus a single line item."""
+
+    header: PurchaseOrderHeader
+    line_item: LineItem
+
+    def value(self, key: str) -> str:
+        if key in LINE_ITEM_KEYS:
+            return getattr(self.line_item, key)
+        return getattr(self.header, key)
+
+    def values(self) -> list[str]:
+        """Return the row's values in ``COLUMNS`` order."""
+        return [self.value(key) for key in COLUMN_KEYS]
+
+    def as_dict(self) -> dict[str, str]:
+        return dict(zip(COLUMN_KEYS, self.values()))
@@ -1,14 +1,27 @@
-from typing import Iterable
+from typing import Iterable, Optional
+
+import requests
+
+from wipt.http_transport import get_shared_session
 
 
 class SheetsClient:
-    def __init__(self, spreadsheet_id: str, worksheet_name: str) -> None:
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         self.spreadsheet_id = spreadsheet_id
         self.worksheet_name = worksheet_name
+        self.session = session or get_shared_session()
 
     def append_row(self, row_values: Iterable[str]) -> None:
         """Append a row into the configured worksheet.
 
-        TODO: Implement Google Sheets API integration.
+        ``row_values`` are ordered as ``wipt.rows.COLUMNS``.
+
+        TODO: Implement Google Sheets API integration over ``self.session``
+        (wrap it in ``wipt.http_transport.AuthorizedHttp`` like ``GmailClient``).
         """
         _ = row_values
@@ -4,16 +4,40 @@ from wipt.config import load_config
 def test_load_config_defaults(monkeypatch: object) -> None:
     monkeypatch.delenv("GMAIL_QUERY", raising=False)
     monkeypatch.delenv("GMAIL_MAX_RESULTS", raising=False)
+    monkeypatch.delenv("GMAIL_NUM_RETRIES", raising=False)
     monkeypatch.delenv("GOOGLE_CLIENT_SECRETS_PATH", raising=False)
     monkeypatch.delenv("GOOGLE_TOKEN_PATH", raising=False)
     monkeypatch.delenv("SHEETS_SPREADSHEET_ID", raising=False)
     monkeypatch.delenv("SHEETS_WORKSHEET_NAME", raising=False)
+    monkeypatch.delenv("HTTP_POOL_SIZE", raising=False)
+    monkeypatch.delenv("HTTP_TIMEOUT_SECONDS", raising=False)
+    monkeypatch.delenv("OCR_ENABLED", raising=False)
+    monkeypatch.delenv("OCR_MAX_WORKERS", raising=False)
+    monkeypatch.delenv("OFFLINE_MODE", raising=False)
+    monkeypatch.delenv("OFFLINE_ARCHIVE_PATH", raising=False)
+    monkeypatch.delenv("OFFLINE_LATENCY_MS", raising=False)
+    monkeypatch.delenv("OFFLINE_ERROR_RATE", raising=False)
+    monkeypatch.delenv("OFFLINE_SEED", raising=False)
+    monkeypatch.delenv("SYNTHETIC_MESSAGE_COUNT", raising=False)
+    monkeypatch.delenv("SYNTHETIC_PDF_PATH", raising=False)
 
     config = load_config()
 
     assert config.gmail_query == "has:attachment filename:pdf"
     assert config.gmail_max_results == 25
+    assert config.gmail_num_retries == 0
     assert config.google_client_secrets_path == ""
     assert config.google_token_path == ""
     assert config.sheets_spreadsheet_id == ""
     assert config.sheets_worksheet_name == "Sheet1"
+    assert config.http_pool_size == 10
+    assert config.http_timeout_seconds == 60
+    assert config.ocr_enabled is False
+    assert config.ocr_max_workers == 2
+    assert config.offline_mode == ""
+    assert config.offline_archive_path == ""
+    assert config.offline_latency_ms == 0
+    assert config.offline_error_rate == 0
+    assert config.offline_seed is None
+    assert config.synthetic_message_count == 100
+    assert config.synthetic_pdf_path == ""
@@ -0,0 +1,142 @@
+import base64
+
+from wipt.gmail_client import GmailClient
+
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("utf-8")
+
+
+class _Call:
+    def __init__(self, result: dict) -> None:
+        self._result = result
+
+    def execute(self, num_retries: int = 0) -> dict:
+        return self._result
+
+
+class _FakeGmailService:
+    def __init__(self, masked_payload: dict, full_payload: dict, attachments: dict[str, bytes]) -> None:
+        self.masked_payload = masked_payload
+        self.full_payload = full_payload
+        self.attachment_data = attachments
+        self.get_calls: list[dict] = []
+
+    def users(self) -> "_FakeGmailService":
+        return self
+
+    def messages(self) -> "_FakeGmailService":
+        return self
+
+    def attachments(self) -> "_FakeAttachments":
+        return _FakeAttachments(self.attachment_data)
+
+    def list(self, **kwargs: object) -> _Call:
+        return _Call({"messages": [{"id": "m1"}]})
+
+    def get(self, **kwargs: object) -> _Call:
+        self.get_calls.append(kwargs)
+        if kwargs.get("fields") == "payload":
+            return _Call({"payload": self.full_payload})
+        return _Call({"id": "m1", "payload": self.masked_payload})
+
+
+class _FakeAttachments:
+    def __init__(self, attachment_data: dict[str, bytes]) -> None:
+        self._attachment_data = attachment_data
+
+    def get(self, userId: str, messageId: str, id: str) -> _Call:
+        return _Call({"data": _encode(self._attachment_data[id])})
+
+
+def _client_with(service: _FakeGmailService) -> GmailClient:
+    client = GmailClient(client_secrets_path="", token_path="")
+    client._service = service
+    return client
+
+
+def test_fetch_messages_uses_field_mask_without_full_payload() -> None:
+    masked_payload = {
+        "partId": "",
+        "mimeType": "multipart/mixed",
+        "headers": [{"name": "Subject", "value": "PO PJM-10738"}],
+        "parts": [
+            {"partId": "0", "mimeType": "text/html", "filename": "", "body": {"size": 50000}},
+            {
+                "partId": "1",
+                "mimeType": "application/pdf",
+                "filename": "po.pdf",
+                "body": {"attachmentId": "a1", "size": 3},
+            },
+        ],
+    }
+    service = _FakeGmailService(masked_payload, full_payload={}, attachments={"a1": b"pdf"})
+
+    messages = list(_client_with(service).fetch_messages(query="has:attachment", max_results=5))
+
+    assert len(service.get_calls) == 1
+    assert "payload(headers(name,value)" in service.get_calls[0]["fields"]
+    assert messages[0].subject == "PO PJM-10738"
+    assert [(a.filename, a.data) for a in messages[0].attachments] == [("po.pdf", b"pdf")]
+
+
+def test_fetch_messages_falls_back_to_full_payload_for_inline_data() -> None:
+    masked_payload = {
+        "partId": "",
+        "mimeType": "multipart/mixed",
+        "headers": [],
+        "parts": [{"partId": "1", "mimeType": "application/pdf", "filename": "inline.pdf", "body": {"size": 6}}],
+    }
+    full_payload = {
+        "partId": "",
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "partId": "1",
+                "mimeType": "application/pdf",
+                "filename": "inline.pdf",
+                "body": {"size": 6, "data": _encode(b"inline")},
+            }
+        ],
+    }
+    service = _FakeGmailService(masked_payload, full_payload, attachments={})
+
+    messages = list(_client_with(service).fetch_messages(query="has:attachment", max_results=5))
+
+    assert service.get_calls[1]["fields"] == "payload"
+    assert [(a.filename, a.data) for a in messages[0].attachments] == [("inline.pdf", b"inline")]
+
+
+def test_fetch_messages_falls_back_to_full_payload_below_mask_depth() -> None:
+    masked_payload = {
+        "partId": "",
+        "mimeType": "multipart/mixed",
+        "headers": [],
+        "parts": [{"partId": "0", "mimeType": "multipart/related", "filename": "", "body": {"size": 0}}],
+    }
+    full_payload = {
+        "partId": "",
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "partId": "0",
+                "mimeType": "multipart/related",
+                "filename": "",
+                "body": {"size": 0},
+                "parts": [
+                    {
+                        "partId": "0.0",
+                        "mimeType": "application/pdf",
+                        "filename": "nested.pdf",
+                        "body": {"attachmentId": "a1", "size": 3},
+                    }
+                ],
+            }
+        ],
+    }
+    service = _FakeGmailService(masked_payload, full_payload, attachments={"a1": b"pdf"})
+
+    messages = list(_client_with(service).fetch_messages(query="has:attachment", max_results=5))
+
+    assert [call.get("fields") for call in service.get_calls].count("payload") == 1
+    assert [(a.filename, a.data) for a in messages[0].attachments] == [("nested.pdf", b"pdf")]
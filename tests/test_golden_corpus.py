@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from wipt.golden import build_corpus, diff_rows, load_expected_rows, run_corpus
+from wipt.pdf_processor import PdfProcessor
+from wipt.rows import COLUMNS
+
+PDF_PATH = Path(__file__).with_name("PO_PJM10738_from_Serial_Cables_LLC_33924.pdf")
+CSV_PATH = Path(__file__).with_name("Purchase Orders - test_data.csv")
+
+
+def test_golden_corpus_matches_expected_rows() -> None:
+    cases = build_corpus(PDF_PATH, CSV_PATH)
+
+    report = run_corpus(PdfProcessor(), cases, repeat=2)
+
+    assert len(cases) == 4
+    assert report.mismatches == []
+    assert report.accuracy == 1.0
+    assert report.documents == 8
+    assert report.docs_per_second > 0
+
+
+def test_diff_rows_reports_changed_and_missing_fields() -> None:
+    expected_rows = load_expected_rows(CSV_PATH)
+    records = PdfProcessor().extract(PDF_PATH.read_bytes()).records
+    expected_rows[0]["price"] = "9.99"
+
+    mismatches, fields_checked = diff_rows("tampered", records[:-1], expected_rows)
+
+    assert fields_checked == len(expected_rows) * len(COLUMNS)
+    assert mismatches[0].row_index == 0
+    assert mismatches[0].column == "price"
+    assert {mismatch.row_index for mismatch in mismatches[1:]} == {len(expected_rows) - 1}
+    assert len(mismatches) == 1 + len(COLUMNS)
+
+
+def test_run_corpus_rejects_non_positive_repeat() -> None:
+    cases = build_corpus(PDF_PATH, CSV_PATH, include_variants=False)
+
+    with pytest.raises(ValueError, match="repeat"):
+        run_corpus(PdfProcessor(), cases, repeat=0)
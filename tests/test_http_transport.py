@@ -0,0 +1,73 @@
+import logging
+
+import requests
+
+from wipt import http_transport
+from wipt.http_transport import AuthorizedHttp, get_shared_session
+
+
+class _FakeCredentials:
+    def __init__(self) -> None:
+        self.token = "stale"
+        self.refresh_count = 0
+
+    def before_request(self, request: object, method: str, url: str, headers: dict) -> None:
+        headers["authorization"] = f"Bearer {self.token}"
+
+    def refresh(self, request: object) -> None:
+        self.refresh_count += 1
+        self.token = "fresh"
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.sent_headers: list[dict] = []
+        self.timeouts: list[float] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: object = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        self.sent_headers.append(headers or {})
+        self.timeouts.append(timeout)
+        response = requests.Response()
+        response.status_code = 401 if headers["authorization"] == "Bearer stale" else 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json"
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Content-Length"] = "7"
+        response._content = b'{"ok": true}'
+        return response
+
+
+def test_authorized_http_refreshes_and_returns_httplib2_style_response() -> None:
+    credentials = _FakeCredentials()
+    session = _FakeSession()
+    http = AuthorizedHttp(credentials, session, timeout=12.5)
+
+    resp, content = http.request("https://example.invalid/api", method="GET", headers={"accept": "application/json"})
+
+    assert credentials.refresh_count == 1
+    assert [headers["authorization"] for headers in session.sent_headers] == ["Bearer stale", "Bearer fresh"]
+    assert resp.status == 200
+    assert resp["status"] == "200"
+    assert resp["content-type"] == "application/json"
+    assert "content-encoding" not in resp
+    assert resp["content-length"] == str(len(content))
+    assert session.timeouts == [12.5, 12.5]
+    assert content == b'{"ok": true}'
+
+
+def test_shared_session_is_created_once_and_warns_on_other_pool_size(caplog: object) -> None:
+    session = get_shared_session()
+
+    with caplog.at_level(logging.WARNING, logger="wipt.http_transport"):
+        assert get_shared_session() is session
+        assert not caplog.records
+        assert get_shared_session(pool_size=http_transport._shared_session_pool_size + 1) is session
+
+    assert "ignoring requested size" in caplog.text
@@ -0,0 +1,103 @@
+import sys
+
+import pytest
+
+from wipt.ocr import OcrEngine
+from wipt.pdf_processor import PdfProcessor
+
+
+def _fake_ocr(pdf_bytes: bytes, page_number: int, resolution: int) -> str:
+    return f"ocr:{pdf_bytes.decode('utf-8')}:{page_number}"
+
+
+def _failing_first_page_ocr(pdf_bytes: bytes, page_number: int, resolution: int) -> str:
+    if page_number == 0:
+        raise ValueError("tesseract crashed")
+    return f"ocr:{page_number}"
+
+
+class _FakeStream:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def get_data(self) -> bytes:
+        return self._data
+
+
+class _FakePageObject:
+    def __init__(self, image: bytes) -> None:
+        self.contents = [_FakeStream(b"q 612 0 0 792 0 0 cm /Im0 Do Q")]
+        self.resources = {"XObject": {"Im0": _FakeStream(image)}}
+
+
+class _FakePage:
+    def __init__(self, image: bytes) -> None:
+        self.page_obj = _FakePageObject(image)
+
+
+def test_ocr_engine_fills_only_text_less_pages_and_caches_by_content() -> None:
+    scanned = _FakePage(b"scan")
+    text_page = _FakePage(b"text")
+    other_scan = _FakePage(b"other")
+    duplicate_scan = _FakePage(b"scan")
+
+    with OcrEngine(max_workers=1, ocr_function=_fake_ocr) as ocr:
+        first = ocr.fill_missing_text(b"first", [scanned, text_page, other_scan], ["", "Purchase Order", ""])
+        second = ocr.fill_missing_text(b"second", [duplicate_scan], ["  "])
+        cache_size = len(ocr._cache)
+
+    assert first == ["ocr:first:0", "Purchase Order", "ocr:first:2"]
+    assert second == ["ocr:first:0"]
+    assert cache_size == 2
+
+
+def test_ocr_engine_leaves_page_empty_when_ocr_fails(caplog: pytest.LogCaptureFixture) -> None:
+    pages = [_FakePage(b"broken"), _FakePage(b"scan")]
+
+    with OcrEngine(max_workers=1, ocr_function=_failing_first_page_ocr) as ocr:
+        filled = ocr.fill_missing_text(b"pdf", pages, ["", ""])
+        cache_size = len(ocr._cache)
+
+    assert filled == ["", "ocr:1"]
+    assert cache_size == 1
+    assert "OCR failed for page 1" in caplog.text
+
+
+class _StubOcr:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def fill_missing_text(self, pdf_bytes: bytes, pages: list[object], pages_text: list[str]) -> list[str]:
+        return [text or self.text for text in pages_text]
+
+
+def test_pdf_processor_feeds_ocr_text_into_extraction_rules() -> None:
+    blank_pdf = (
+        b"%PDF-1.1\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+        b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+        b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n"
+        b"trailer<</Root 1 0 R>>\n%%EOF"
+    )
+    ocr_text = "\n".join(
+        [
+            "Serial Cables, LLC",
+            "Purchase Order",
+            "Date 1/5/2026",
+            "P.O. No. PJM-10795",
+            "MCIO6-8X-39X2U2XC-1X4-0.5M Gen6 MCIO 8X (SFF-1016) 74P to *2 10 61.15 611.50",
+        ]
+    )
+
+    result = PdfProcessor(ocr=_StubOcr(ocr_text)).extract(blank_pdf)
+
+    assert len(result.rows) == 1
+    assert result.rows[0]["purchase_order_id"] == "PJM-10795"
+    assert result.rows[0]["purchase_order_date"] == "1/5/2026"
+    assert result.rows[0]["item"] == "MCIO6-8X-39X2U2XC-1X4-0.5M"
+
+
+def test_ocr_engine_fails_at_startup_without_tesseract(monkeypatch: object) -> None:
+    monkeypatch.setitem(sys.modules, "pytesseract", None)
+
+    with pytest.raises(RuntimeError, match="tesseract"):
+        OcrEngine()
@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+import time
+
+import pytest
+
+from wipt.gmail_client import GmailClient
+from wipt.main import main
+from wipt.offline import (
+    ArchiveSheetsClient,
+    OfflineArchive,
+    RecordingHttp,
+    ReplayHttp,
+    SyntheticMailboxHttp,
+    load_offline_archive,
+)
+from wipt.pdf_processor import PdfProcessor
+
+PDF_PATH = Path(__file__).with_name("PO_PJM10738_from_Serial_Cables_LLC_33924.pdf")
+
+
+def _fetch(http: object, max_results: int, num_retries: int = 0) -> list:
+    client = GmailClient(client_secrets_path="", token_path="", http=http, num_retries=num_retries)
+    return list(client.fetch_messages(query="has:attachment filename:pdf", max_results=max_results))
+
+
+def test_synthetic_mailbox_serves_gmail_client() -> None:
+    pdf_bytes = b"%PDF-synthetic"
+
+    messages = _fetch(SyntheticMailboxHttp(message_count=600, pdf_bytes=pdf_bytes), max_results=550)
+
+    assert len(messages) == 550
+    assert len({message.message_id for message in messages}) == 550
+    assert messages[-1].message_id == "synthetic-00549"
+    assert messages[0].subject == "Synthetic purchase order 0"
+    assert [attachment.filename for attachment in messages[0].attachments] == ["PO_synthetic_00000.pdf"]
+    assert messages[0].attachments[0].data == pdf_bytes
+
+
+def test_recorded_archive_replays_same_messages(tmp_path: Path) -> None:
+    archive = OfflineArchive()
+    recorder = RecordingHttp(SyntheticMailboxHttp(message_count=3, pdf_bytes=b"%PDF-synthetic"), archive)
+    recorded = _fetch(recorder, max_results=3)
+    ArchiveSheetsClient("sheet-id", "Sheet1", archive).append_row(["PJM-10738", "CBL-01004-01-A"])
+    archive_path = tmp_path / "archive.json"
+    archive.save(archive_path)
+
+    reloaded = OfflineArchive.load(archive_path)
+    replayed = _fetch(ReplayHttp(reloaded), max_results=3)
+
+    assert len(reloaded.responses) == 1 + 3 * 2
+    assert reloaded.sheet_rows == [["PJM-10738", "CBL-01004-01-A"]]
+    assert replayed == recorded
+
+    client = GmailClient(client_secrets_path="", token_path="", http=ReplayHttp(reloaded))
+    assert list(client.fetch_messages(query="has:attachment filename:pdf", max_results=5)) == []
+    assert client.list_error.resp.status == 404
+
+
+def test_synthetic_list_pages_are_capped_like_gmail() -> None:
+    http = SyntheticMailboxHttp(message_count=1200, pdf_bytes=b"%PDF-synthetic")
+
+    response, content = http.request("https://gmail.googleapis.com/gmail/v1/users/me/messages?maxResults=10000")
+    page = json.loads(content)
+
+    assert response.status == 200
+    assert len(page["messages"]) == 500
+    assert page["nextPageToken"] == "500"
+
+
+def test_run_finishes_under_injected_errors(monkeypatch: object) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    http = SyntheticMailboxHttp(message_count=40, pdf_bytes=b"%PDF-synthetic", error_rate=0.3, seed=7)
+    client = GmailClient(client_secrets_path="", token_path="", http=http, num_retries=2)
+
+    messages = list(client.fetch_messages(query="has:attachment filename:pdf", max_results=40))
+
+    assert http.injected_errors > 0
+    assert len(messages) + len(client.failed_message_ids) == 40
+    assert len(messages) > len(client.failed_message_ids)
+
+
+def test_failed_list_page_ends_listing_without_raising() -> None:
+    http = SyntheticMailboxHttp(message_count=5, pdf_bytes=b"%PDF-synthetic", error_rate=1.0)
+    client = GmailClient(client_secrets_path="", token_path="", http=http)
+
+    messages = list(client.fetch_messages(query="has:attachment filename:pdf", max_results=5))
+
+    assert messages == []
+    assert client.failed_message_ids == []
+    assert client.list_error.resp.status == 503
+
+
+def test_main_reports_messages_skipped_under_injected_errors(
+    monkeypatch: object,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    archives: list[OfflineArchive] = []
+
+    def load_archive(config: object) -> OfflineArchive:
+        archives.append(load_offline_archive(config))
+        return archives[-1]
+
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    monkeypatch.setattr("wipt.main.load_offline_archive", load_archive)
+    monkeypatch.setenv("OFFLINE_MODE", "synthetic")
+    monkeypatch.setenv("SYNTHETIC_PDF_PATH", str(PDF_PATH))
+    monkeypatch.setenv("SYNTHETIC_MESSAGE_COUNT", "6")
+    monkeypatch.setenv("GMAIL_MAX_RESULTS", "6")
+    monkeypatch.setenv("GMAIL_NUM_RETRIES", "1")
+    monkeypatch.setenv("OFFLINE_ERROR_RATE", "0.3")
+    monkeypatch.setenv("OFFLINE_SEED", "3")
+
+    exit_status = main()
+
+    rows_per_message = len(PdfProcessor().extract(PDF_PATH.read_bytes()).records)
+    assert exit_status == 1
+    assert len(archives[0].sheet_rows) == 4 * rows_per_message
+    assert "Skipped 2 Gmail message(s): synthetic-" in caplog.text
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+import sys
+
+from wipt import cli
+from wipt.pdf_processor import PdfExtractionResult
+from wipt.rows import COLUMN_KEYS, LineItem, PurchaseOrderHeader, PurchaseOrderRow
+
+
+def test_rows_share_header_and_expose_values_in_column_order() -> None:
+    header = PurchaseOrderHeader(purchase_order_id="PJM-10738", purchase_order_date="12/5/2025")
+    records = [
+        PurchaseOrderRow(header=header, line_item=LineItem("CBL-1", "Cable", "2", "1.50", "3.00")),
+        PurchaseOrderRow(header=header, line_item=LineItem("CBL-2", "Cable", "1", "2.00", "2.00")),
+    ]
+
+    assert records[0].header is records[1].header
+    values = records[0].values()
+    assert len(values) == len(COLUMN_KEYS)
+    assert values[COLUMN_KEYS.index("purchase_order_id")] == "PJM-10738"
+    assert values[COLUMN_KEYS.index("item")] == "CBL-1"
+    assert values[COLUMN_KEYS.index("status")] == "NEW"
+
+
+def test_extraction_result_rows_are_plain_dicts() -> None:
+    header = PurchaseOrderHeader(purchase_order_id="PJM-10738")
+    record = PurchaseOrderRow(header=header, line_item=LineItem("CBL-1", "Cable", "2", "1.50", "3.00"))
+    result = PdfExtractionResult(records=[record])
+
+    assert result.rows == [dict(zip(COLUMN_KEYS, record.values()))]
+    assert result.rows is result.rows
+    assert json.loads(json.dumps(result.rows)) == result.rows
+    assert list(result.rows[0]) == list(COLUMN_KEYS)
+    assert result.rows[0]["item"] == "CBL-1"
+    assert result.rows[0]["invoice_created"] == "No"
+
+
+def test_extract_cli_prints_rows_in_column_order(monkeypatch: object, capsys: object) -> None:
+    pdf_path = Path(__file__).with_name("PO_PJM10738_from_Serial_Cables_LLC_33924.pdf")
+    monkeypatch.setattr(sys, "argv", ["wipt", "extract", "--pdf", str(pdf_path)])
+
+    assert cli.main() == 0
+
+    rows = json.loads(capsys.readouterr().out)
+    assert rows
+    assert all(list(row) == list(COLUMN_KEYS) for row in rows)